@@ -1,44 +1,222 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 import time
 import os
+import shutil
+import sys
 import argparse
-from urllib.parse import urljoin
+import re
+import html
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, parse_qs
 
 # Base URL
 BASE_URL = "https://openaccess.thecvf.com/"
 
+# Shared HTTP session: keep-alive connections to the CVF host are reused across
+# requests, and throttled (429) or failed (5xx) requests are retried with
+# exponential backoff, honouring the server's Retry-After header
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = "scrape_cvf_paper"
+
+def size_connection_pool(pool_maxsize):
+    """
+    Mounts the HTTPS adapter of SESSION, keeping up to pool_maxsize connections alive.
+    Every thread that may fetch at the same time needs its own connection;
+    urllib3 discards the surplus ones otherwise.
+    """
+    SESSION.mount('https://', HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    ))
+
+size_connection_pool(32)
+
+# Detail pages only need the abstract <div>; skip the rest of the tree
+DETAIL_STRAINER = SoupStrainer('div', id='abstract')
+
+# Listing pages only need the paper <dt>/<dd> entries; the <dd> siblings
+# are kept because they carry the listing's PDF links
+LISTING_STRAINER = SoupStrainer(['dt', 'dd'])
+
+# The conference main page is only searched for its ?day= links
+DAY_LINK_STRAINER = SoupStrainer('a', href=re.compile(r'\?day='))
+
+# First link to a .pdf on a detail page, matched on the raw response bytes
+PDF_HREF_RE = re.compile(rb'<a\s[^>]*?href=["\']([^"\'>]+\.pdf)["\']')
+
+# Characters dropped from PDF filenames: anything but letters, digits, space, '-' and '_'
+UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+
+# Buffer size used when streaming PDFs to disk
+PDF_CHUNK_SIZE = 1024 * 1024
+
+# Default number of concurrent PDF downloads (--pdf-workers)
+PDF_WORKERS = 8
+
+# Column order of every output sheet
+COLUMNS = ["Conference", "Year", "Title", "Abstract", "URL", "PDF_URL", "PDF_Path"]
+
+# On-disk cache of detail pages, enabled with --cache-file (see open_page_cache)
+CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+_cache_conn = None
+_cache_refresh = False  # Revalidate every cached page with the server
+_cache_lock = threading.Lock()
+
+# Details of every paper fetched successfully in this run, keyed by detail page URL
+_details_by_url = {}
+
+# Spacing between requests across all threads, enabled with --max-rate (see set_max_rate)
+_min_interval = 0.0  # seconds
+_next_request_at = 0.0
+_rate_lock = threading.Lock()
+
+# Serialises progress lines written while the PDF workers are running
+_print_lock = threading.Lock()
+
+def log(message):
+    """
+    Prints one progress line in a single write, so lines from different threads never mix.
+    """
+    with _print_lock:
+        sys.stdout.write(f"{message}\n")
+        sys.stdout.flush()
+
+def set_max_rate(max_rate):
+    """
+    Limits all threads together to max_rate requests per second; 0 removes the limit.
+    """
+    global _min_interval
+    _min_interval = 1.0 / max_rate if max_rate else 0.0
+
+def http_get(url, **kwargs):
+    """
+    SESSION.get, waiting for the next free request slot when --max-rate is set.
+    """
+    global _next_request_at
+    if _min_interval:
+        # Reserve a slot under the lock, then sleep outside it so other threads can queue up
+        with _rate_lock:
+            now = time.monotonic()
+            wait = _next_request_at - now
+            _next_request_at = max(now, _next_request_at) + _min_interval
+        if wait > 0:
+            time.sleep(wait)
+    return SESSION.get(url, **kwargs)
+
+def open_page_cache(cache_file, refresh=False):
+    """
+    Opens (or creates) the SQLite cache of fetched detail pages.
+    """
+    global _cache_conn, _cache_refresh
+    _cache_conn = sqlite3.connect(cache_file, check_same_thread=False)
+    _cache_refresh = refresh
+    _cache_conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages "
+        "(url TEXT PRIMARY KEY, body BLOB, fetched_at REAL, etag TEXT, last_modified TEXT)"
+    )
+    # Caches written before validators were stored lack the last two columns
+    columns = {row[1] for row in _cache_conn.execute("PRAGMA table_info(pages)")}
+    for column in ("etag", "last_modified"):
+        if column not in columns:
+            _cache_conn.execute(f"ALTER TABLE pages ADD COLUMN {column} TEXT")
+    _cache_conn.commit()
+
+def fetch_page(url, timeout):
+    """
+    Returns the raw body of a page, served from the page cache when it is open and fresh.
+    A stale or refreshed cache entry is revalidated with its ETag/Last-Modified,
+    so an unchanged page costs a bodyless 304 instead of a full download.
+    """
+    row = None
+    if _cache_conn is not None:
+        with _cache_lock:
+            row = _cache_conn.execute(
+                "SELECT body, fetched_at, etag, last_modified FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row and not _cache_refresh and time.time() - row[1] < CACHE_MAX_AGE:
+            return row[0]
+
+    headers = {}
+    if row and row[2]:
+        headers['If-None-Match'] = row[2]
+    if row and row[3]:
+        headers['If-Modified-Since'] = row[3]
+
+    response = http_get(url, timeout=timeout, headers=headers)
+    response.raise_for_status()
+
+    if response.status_code == 304:
+        body = row[0]
+        etag = response.headers.get('ETag', row[2])
+        last_modified = response.headers.get('Last-Modified', row[3])
+    else:
+        body = response.content
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+    if _cache_conn is not None:
+        with _cache_lock:
+            _cache_conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (url, body, time.time(), etag, last_modified)
+            )
+            _cache_conn.commit()
+
+    return body
+
 def get_paper_details(paper_url):
     """
     Fetches the abstract and PDF URL from the paper's detail page.
+    Papers listed more than once in a run are only fetched the first time.
     """
+    details = _details_by_url.get(paper_url)
+    if details is not None:
+        return details
+
     try:
-        response = requests.get(paper_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        content = fetch_page(paper_url, timeout=10)
+        soup = BeautifulSoup(content, 'lxml', parse_only=DETAIL_STRAINER)
 
         # Extract Abstract
-        abstract_div = soup.find('div', id='abstract')
+        abstract_div = soup.select_one('#abstract')
         abstract = abstract_div.get_text(strip=True) if abstract_div else ""
         
         # Remove the leading "Abstract" label if present
-        if abstract.startswith("Abstract"):
-            abstract = abstract[len("Abstract"):].strip()
+        abstract = abstract.removeprefix("Abstract").strip()
         
         # Extract PDF URL
         pdf_url = ""
         # Look for PDF link (usually an <a> tag with href ending in .pdf)
-        pdf_link = soup.find('a', href=lambda x: x and x.endswith('.pdf'))
-        if pdf_link:
-            pdf_url = urljoin(BASE_URL, pdf_link['href'])
+        pdf_match = PDF_HREF_RE.search(content)
+        if pdf_match:
+            pdf_href = html.unescape(pdf_match.group(1).decode('utf-8', 'replace'))
+            pdf_url = urljoin(BASE_URL, pdf_href)
         
+        _details_by_url[paper_url] = abstract, pdf_url
         return abstract, pdf_url
 
     except Exception as e:
-        print(f"Error fetching details for {paper_url}: {e}")
+        log(f"Error fetching details for {paper_url}: {e}")
         return "", ""
 
+def sanitize_filename(filename):
+    """
+    Strips characters that are unsafe in filenames and limits the length.
+    """
+    return UNSAFE_FILENAME_RE.sub('', filename).rstrip()[:200]
+
 def download_pdf(pdf_url, save_dir, filename):
     """
     Downloads a PDF file from the given URL.
@@ -47,111 +225,166 @@ def download_pdf(pdf_url, save_dir, filename):
         # Create directory if it doesn't exist
         os.makedirs(save_dir, exist_ok=True)
         
-        # Sanitize filename
-        safe_filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_filename = safe_filename[:200]  # Limit filename length
+        safe_filename = sanitize_filename(filename)
         filepath = os.path.join(save_dir, f"{safe_filename}.pdf")
         
         # Skip if file already exists
         if os.path.exists(filepath):
-            print(f"    PDF already exists: {safe_filename}.pdf")
+            log(f"    PDF already exists: {safe_filename}.pdf")
             return filepath
         
-        # Download PDF
-        response = requests.get(pdf_url, timeout=30, stream=True)
-        response.raise_for_status()
+        # Download PDF into a temporary file and rename it once complete,
+        # so an interrupted download is never mistaken for a finished one
+        part_path = f"{filepath}.part"
         
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Resume a partial download left behind by an interrupted run
+        resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {'Range': f"bytes={resume_from}-"} if resume_from else {}
         
-        print(f"    Downloaded PDF: {safe_filename}.pdf")
+        with http_get(pdf_url, timeout=30, stream=True, headers=headers) as response:
+            if response.status_code == 416:
+                # Content-Range: bytes */<total> says how big the file really is
+                total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if total.isdigit() and int(total) == resume_from:
+                    # The earlier run got every byte but stopped before the rename
+                    os.replace(part_path, filepath)
+                    log(f"    Downloaded PDF: {safe_filename}.pdf")
+                    return filepath
+                # The partial file does not match the PDF; start over next time
+                os.remove(part_path)
+            response.raise_for_status()
+            if response.status_code != 206:
+                resume_from = 0  # Range not honoured, the full body follows
+            response.raw.decode_content = True
+            with open(part_path, 'ab' if resume_from else 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=PDF_CHUNK_SIZE)
+            
+            # Keep the partial file for resuming if the body was cut short
+            expected_size = response.headers.get('Content-Length')
+            if expected_size and 'Content-Encoding' not in response.headers:
+                if os.path.getsize(part_path) != resume_from + int(expected_size):
+                    raise IOError("connection closed before the PDF was complete")
+        os.replace(part_path, filepath)
+        
+        log(f"    Downloaded PDF: {safe_filename}.pdf")
         return filepath
         
     except Exception as e:
-        print(f"    Error downloading PDF: {e}")
+        log(f"    Error downloading PDF: {e}")
+        return ""
+
+def find_listing_pdf_url(dt):
+    """
+    Returns the PDF URL linked from the <dd> entries following a paper's <dt>, or "".
+    """
+    for sibling in dt.next_siblings:
+        if sibling.name is None:  # Text between tags
+            continue
+        if sibling.name != 'dd':
+            break
+        pdf_link = sibling.select_one('a[href$=".pdf"]')
+        if pdf_link:
+            return urljoin(BASE_URL, pdf_link['href'])
+    return ""
+
+def guess_pdf_url(paper_url):
+    """
+    Derives the PDF URL from a detail page URL using CVF's html/ -> papers/ layout, or "".
+    """
+    if '/html/' not in paper_url or not paper_url.endswith('.html'):
         return ""
+    return paper_url.replace('/html/', '/papers/', 1)[:-len('.html')] + '.pdf'
 
-def scrape_year(year, conference, download_pdfs=False, pdf_dir=""):
+def scrape_year(year, conference, download_pdfs=False, pdf_dir="", pdf_executor=None, detail_workers=8, fetch_abstracts=True):
     """
     Scrapes all papers for a specific year and conference.
+    Without a shared pdf_executor, each day downloads its PDFs on a pool of its own.
     """
-    print(f"Starting scrape for {conference.upper()} {year}...")
+    log(f"Starting scrape for {conference.upper()} {year}...")
     
     # First try to get all papers at once using day=all
     url_all = f"{BASE_URL}{conference.upper()}{year}?day=all"
     
     try:
-        response = requests.get(url_all, timeout=20)
+        response = http_get(url_all, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=LISTING_STRAINER)
         
         # Check if we actually got papers (look for ptitle elements)
-        dt_elements = soup.find_all('dt', class_='ptitle')
+        dt_elements = soup.select('dt.ptitle')
         
         if len(dt_elements) > 0:
             # day=all works, use it
-            print(f"  Using day=all for {conference.upper()} {year}")
-            return scrape_day(url_all, year, "all", conference, download_pdfs, pdf_dir)
+            log(f"  Using day=all for {conference.upper()} {year}")
+            # Reuse the page we just parsed instead of fetching it again
+            return scrape_day(url_all, year, "all", conference,
+                              download_pdfs=download_pdfs, pdf_dir=pdf_dir, pdf_executor=pdf_executor,
+                              detail_workers=detail_workers, fetch_abstracts=fetch_abstracts, soup=soup)
         else:
             # day=all returned no papers, need to try individual days
-            print(f"  day=all returned no papers, trying to find individual days...")
+            log(f"  day=all returned no papers, trying to find individual days...")
             
     except Exception as e:
-        print(f"  day=all failed: {e}, trying to find individual days...")
+        log(f"  day=all failed: {e}, trying to find individual days...")
     
     # If day=all doesn't work, try to scrape by individual days
     # First, get the main conference page to find available days
     main_url = f"{BASE_URL}{conference.upper()}{year}"
     
     try:
-        response = requests.get(main_url, timeout=20)
+        response = http_get(main_url, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=DAY_LINK_STRAINER)
         
-        # Find day links in the navigation (usually in <dd> tags or links with ?day= parameter)
-        day_links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if '?day=' in href and href not in day_links:
-                # Extract the day parameter
-                if 'day=' in href:
-                    day_links.append(href)
+        # Find day links in the navigation (usually in <dd> tags or links with ?day= parameter),
+        # keyed by day value so links to the same day in different forms are scraped once, in page order
+        day_links = {}
+        for link in soup.select('a[href*="?day="]'):
+            day_param = parse_qs(urlparse(link['href']).query).get('day', [''])[0]
+            day_links.setdefault(day_param, link['href'])
         
         if day_links:
-            print(f"  Found {len(day_links)} day(s) to scrape")
+            log(f"  Found {len(day_links)} day(s) to scrape")
             all_papers = []
-            for link in day_links:
-                # Extract day value from the link
-                day_param = link.split('day=')[1].split('&')[0] if '&' in link.split('day=')[1] else link.split('day=')[1]
+            for day_param, link in day_links.items():
                 full_url = urljoin(BASE_URL, link)
-                papers = scrape_day(full_url, year, day_param, conference, download_pdfs, pdf_dir)
+                papers = scrape_day(full_url, year, day_param, conference,
+                                    download_pdfs=download_pdfs, pdf_dir=pdf_dir, pdf_executor=pdf_executor,
+                                    detail_workers=detail_workers, fetch_abstracts=fetch_abstracts)
                 all_papers.extend(papers)
             return all_papers
         else:
-            print(f"  Warning: Could not find day links for {conference.upper()} {year}")
+            log(f"  Warning: Could not find day links for {conference.upper()} {year}")
             # Last resort: try day=all anyway
-            return scrape_day(url_all, year, "all", conference, download_pdfs, pdf_dir)
+            return scrape_day(url_all, year, "all", conference,
+                              download_pdfs=download_pdfs, pdf_dir=pdf_dir, pdf_executor=pdf_executor,
+                              detail_workers=detail_workers, fetch_abstracts=fetch_abstracts)
             
     except Exception as e:
-        print(f"  Error accessing main page: {e}")
+        log(f"  Error accessing main page: {e}")
         # Last resort: try day=all anyway
-        return scrape_day(url_all, year, "all", conference, download_pdfs, pdf_dir)
+        return scrape_day(url_all, year, "all", conference,
+                          download_pdfs=download_pdfs, pdf_dir=pdf_dir, pdf_executor=pdf_executor,
+                          detail_workers=detail_workers, fetch_abstracts=fetch_abstracts)
 
-def scrape_day(url, year, day, conference, download_pdfs=False, pdf_dir=""):
+def scrape_day(url, year, day, conference, download_pdfs=False, pdf_dir="", pdf_executor=None, detail_workers=8, fetch_abstracts=True, soup=None):
     """
     Scrapes papers from a specific day/page.
+    An already parsed listing can be passed as soup to skip fetching url.
+    PDF downloads are submitted to pdf_executor as soon as each link is known;
+    when none is given, a pool is created for this day and shut down before returning.
     """
-    print(f"  Fetching {day} for {year}...")
-    
-    try:
-        response = requests.get(url, timeout=20)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Failed to fetch page for {year} {day}: {e}")
-        return []
+    if soup is None:
+        log(f"  Fetching {day} for {year}...")
+        
+        try:
+            response = http_get(url, timeout=20)
+            response.raise_for_status()
+        except Exception as e:
+            log(f"Failed to fetch page for {year} {day}: {e}")
+            return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=LISTING_STRAINER)
     
     # Find all paper titles. They are usually in <dt> tags with class 'ptitle'
     # Or just links inside <dt> tags.
@@ -160,52 +393,212 @@ def scrape_day(url, year, day, conference, download_pdfs=False, pdf_dir=""):
     # <dd>...authors...</dd>
     
     papers_data = []
+    download_jobs = []  # (paper, future) for PDFs downloading in the background
     
-    # Find all dt elements with class 'ptitle'
-    dt_elements = soup.find_all('dt', class_='ptitle')
+    # Find the title link of every dt element with class 'ptitle' in one pass
+    title_links = soup.select('dt.ptitle > a:first-of-type')
     
-    print(f"  Found {len(dt_elements)} papers for {year} {day}.")
+    log(f"  Found {len(title_links)} papers for {year} {day}.")
     
-    for i, dt in enumerate(dt_elements):
-        a_tag = dt.find('a')
-        if not a_tag:
-            continue
+    # (title, full_link, listing_pdf_url) in page order
+    entries = [
+        (a_tag.get_text(strip=True), urljoin(BASE_URL, a_tag['href']), find_listing_pdf_url(a_tag.parent))
+        for a_tag in title_links
+    ]
+    
+    # Callers that do not share a run-wide pool get one for this day's downloads
+    local_pdf_executor = None
+    if download_pdfs and pdf_executor is None:
+        pdf_executor = local_pdf_executor = ThreadPoolExecutor(max_workers=PDF_WORKERS)
+    
+    # Get details (Abstract, PDF URL) concurrently: each detail page is an
+    # independent request, so worker threads overlap the network waits.
+    # executor.map yields results in page order; a paper listed twice is
+    # fetched once. Without abstracts the listing already has everything,
+    # so no detail page is requested.
+    conference_name = conference.upper()  # One string shared by every row
+    details_by_link = {}
+    download_futures = {}  # PDF target path -> future, shared by rows saving to the same file
+    detail_executor = ThreadPoolExecutor(max_workers=detail_workers)
+    try:
+        if fetch_abstracts:
+            unique_links = list(dict.fromkeys(link for _, link, _ in entries))
+            fetched = zip(unique_links, detail_executor.map(get_paper_details, unique_links))
+        for i, (title, full_link, listing_pdf_url) in enumerate(entries):
+            if fetch_abstracts:
+                # Links arrive in first-seen order, so this paper's is at most the next one
+                while full_link not in details_by_link:
+                    link, details = next(fetched)
+                    details_by_link[link] = details
+                abstract, pdf_url = details_by_link[full_link]
+                log(f"  [{i+1}/{len(entries)}] Fetched details for: {title[:50]}...")
+            else:
+                abstract, pdf_url = "", ""
+            pdf_url = pdf_url or listing_pdf_url
+            if not fetch_abstracts:
+                # Without the detail page, fall back to the usual CVF path when the listing has no link
+                pdf_url = pdf_url or guess_pdf_url(full_link)
             
-        title = a_tag.get_text(strip=True)
-        relative_link = a_tag['href']
-        full_link = urljoin(BASE_URL, relative_link)
-        
-        # Get details (Abstract, Keywords)
-        # To be polite and avoid rate limits, we might want to sleep, 
-        # but for 2000+ papers it will take forever. 
-        # We'll try to run without sleep but handle errors.
-        # For the user's script, I'll add a small delay or just let it run.
-        # To speed up, one could use threading, but let's keep it simple and robust first.
-        
-        print(f"  [{i+1}/{len(dt_elements)}] Fetching details for: {title[:50]}...")
-        abstract, pdf_url = get_paper_details(full_link)
-        
-        # Download PDF if requested
-        pdf_path = ""
-        if download_pdfs and pdf_url:
-            pdf_filename = f"{conference}_{year}_{title}"
-            pdf_path = download_pdf(pdf_url, pdf_dir, pdf_filename)
-        
-        papers_data.append({
-            "Conference": conference.upper(),
-            "Year": year,
-            "Title": title,
-            "Abstract": abstract,
-            "URL": full_link,
-            "PDF_URL": pdf_url,
-            "PDF_Path": pdf_path
-        })
-        
-        # Optional: Sleep to be polite
-        # time.sleep(0.1) 
+            paper = {
+                "Conference": conference_name,
+                "Year": year,
+                "Title": title,
+                "Abstract": abstract,
+                "URL": full_link,
+                "PDF_URL": pdf_url,
+                "PDF_Path": ""
+            }
+            papers_data.append(paper)
+            
+            # Start the PDF download now so it overlaps the remaining detail fetches.
+            # Rows whose titles clean up to the same filename reuse one download,
+            # since two jobs writing the same .part file would corrupt it
+            if download_pdfs and pdf_url:
+                filename = f"{conference}_{year}_{title}"
+                target = os.path.join(pdf_dir, sanitize_filename(filename))
+                future = download_futures.get(target)
+                if future is None:
+                    future = download_futures[target] = pdf_executor.submit(download_pdf, pdf_url, pdf_dir, filename)
+                download_jobs.append((paper, future))
+
+        if download_jobs:
+            log(f"  Waiting for {len(download_futures)} PDF download(s)...")
+            for paper, future in download_jobs:
+                paper["PDF_Path"] = future.result()
+    except BaseException:
+        # On Ctrl-C or an error, drop the queued fetches and downloads instead of
+        # letting the pools work through the rest of the day before exiting
+        detail_executor.shutdown(cancel_futures=True)
+        if local_pdf_executor:
+            local_pdf_executor.shutdown(cancel_futures=True)
+        raise
+    detail_executor.shutdown()
+    if local_pdf_executor:
+        local_pdf_executor.shutdown()
 
     return papers_data
 
+def append_checkpoint(checkpoint_file, sheet_name, papers, options):
+    """
+    Appends a finished conference/year to the JSON Lines progress checkpoint,
+    along with the options that shaped its rows.
+    """
+    entry = {"sheet": sheet_name, "options": options, "papers": papers}
+    with open(checkpoint_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+def load_checkpoint(checkpoint_file, options):
+    """
+    Returns the papers of every conference/year recorded in the progress checkpoint
+    by a run with the same options.
+    """
+    papers_by_sheet = {}
+    complete_size = 0
+    with open(checkpoint_file, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n"):  # Cut short by an interrupted write
+                break
+            complete_size += len(line)
+            entry = json.loads(line)
+            if entry.get("options") == options:
+                papers_by_sheet[entry["sheet"]] = entry["papers"]
+    # Drop the partial line, so the next appended entry starts on a fresh line
+    if complete_size < os.path.getsize(checkpoint_file):
+        os.truncate(checkpoint_file, complete_size)
+    return papers_by_sheet
+
+def load_saved_papers(output_dir, sheet_name, output_format, options):
+    """
+    Returns the papers of a conference/year already written as Parquet/CSV, or None.
+    Files saved with other options, or without their options file, are not reused.
+    """
+    path = os.path.join(output_dir, f"{sheet_name}.{output_format}")
+    if not os.path.exists(path) or not os.path.exists(f"{path}.options.json"):
+        return None
+    with open(f"{path}.options.json", encoding='utf-8') as f:
+        if json.load(f) != options:
+            return None
+    if output_format == 'parquet':
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, keep_default_na=False)
+    return df.to_dict('records')
+
+def write_options_file(path, options):
+    """
+    Records the options a Parquet/CSV file was saved with; None removes the record.
+    """
+    options_file = f"{path}.options.json"
+    if options is None:
+        if os.path.exists(options_file):
+            os.remove(options_file)
+        return
+    with open(f"{options_file}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(options, f)
+    os.replace(f"{options_file}.tmp", options_file)
+
+def save_papers_to_excel(output_file, papers_by_sheet, engine='openpyxl'):
+    """
+    Writes one sheet per conference/year to the Excel file.
+    The workbook is written under a temporary name and renamed once complete.
+    """
+    root, ext = os.path.splitext(output_file)
+    tmp_file = f"{root}.tmp{ext}"  # pandas picks the writer by extension
+    if engine == 'xlsxwriter':
+        # constant_memory flushes each row to disk as soon as it is written,
+        # so peak memory stays at about one row regardless of sheet size;
+        # URLs are stored as plain strings, as with openpyxl, which skips
+        # hyperlink detection on every cell
+        import xlsxwriter
+        workbook = xlsxwriter.Workbook(tmp_file, {
+            'constant_memory': True,
+            'use_zip64': True,
+            'strings_to_urls': False,
+        })
+        header_format = workbook.add_format({'bold': True})
+        for sheet_name, papers in papers_by_sheet.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, COLUMNS, header_format)
+            for row, paper in enumerate(papers, start=1):
+                worksheet.write_row(row, 0, [paper[col] for col in COLUMNS])
+        workbook.close()
+    else:
+        with pd.ExcelWriter(tmp_file, engine='openpyxl') as writer:
+            for sheet_name, papers in papers_by_sheet.items():
+                df = pd.DataFrame(papers)
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+    os.replace(tmp_file, output_file)
+
+def save_papers_to_parquet(output_dir, papers_by_sheet, options):
+    """
+    Writes one Parquet file per conference/year into the output directory.
+    Each file is renamed into place once complete, so resuming never reads a partial file.
+    The options go to a <file>.options.json written last, so a file is only resumed
+    once both are complete.
+    """
+    for sheet_name, papers in papers_by_sheet.items():
+        df = pd.DataFrame(papers, columns=COLUMNS)
+        path = os.path.join(output_dir, f"{sheet_name}.parquet")
+        write_options_file(path, None)
+        df.to_parquet(f"{path}.tmp", index=False, compression='zstd')
+        os.replace(f"{path}.tmp", path)
+        write_options_file(path, options)
+
+def save_papers_to_csv(output_dir, papers_by_sheet, options):
+    """
+    Writes one CSV file per conference/year into the output directory.
+    Each file is renamed into place once complete, so resuming never reads a partial file.
+    The options go to a <file>.options.json written last, so a file is only resumed
+    once both are complete.
+    """
+    for sheet_name, papers in papers_by_sheet.items():
+        df = pd.DataFrame(papers, columns=COLUMNS)
+        path = os.path.join(output_dir, f"{sheet_name}.csv")
+        write_options_file(path, None)
+        df.to_csv(f"{path}.tmp", index=False, encoding='utf-8')
+        os.replace(f"{path}.tmp", path)
+        write_options_file(path, options)
+
 def parse_arguments():
     """
     Parse command line arguments.
@@ -255,7 +648,14 @@ Examples:
         '--output-dir', '-od',
         type=str,
         default='xlsx',
-        help='Directory to save output Excel files (default: xlsx)'
+        help='Directory to save output files (default: xlsx)'
+    )
+    
+    parser.add_argument(
+        '--output-format', '-of',
+        choices=['xlsx', 'parquet', 'csv'],
+        default='xlsx',
+        help='Output format: one Excel workbook, or one Parquet/CSV file per conference/year (default: xlsx)'
     )
     
     parser.add_argument(
@@ -271,12 +671,78 @@ Examples:
         help='Directory to save PDF files (default: pdf)'
     )
     
+    parser.add_argument(
+        '--pdf-workers', '-pw',
+        type=int,
+        default=PDF_WORKERS,
+        help='Number of concurrent PDF downloads (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--no-abstract', '-na',
+        action='store_true',
+        help='Skip paper detail pages: abstracts are left empty and PDF links are taken from the listing'
+    )
+    
+    parser.add_argument(
+        '--detail-workers', '-dw',
+        type=int,
+        default=8,
+        help='Number of concurrent paper detail page requests (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--max-rate', '-mr',
+        type=float,
+        default=0,
+        help='Maximum requests per second across all workers, 0 for no limit (default: 0)'
+    )
+    
+    parser.add_argument(
+        '--no-resume', '-nr',
+        action='store_true',
+        help=('Scrape every conference/year again instead of reusing years saved by an earlier run '
+              'with the same --no-abstract/--download-pdf/--pdf-dir. xlsx only resumes an interrupted run: '
+              'a finished run deletes its checkpoint, so the next run scrapes again. '
+              'parquet/csv skip every year already in the output directory')
+    )
+    
+    parser.add_argument(
+        '--cache-file', '-cf',
+        type=str,
+        default=None,
+        help='SQLite file caching paper detail pages across runs (default: disabled)'
+    )
+    
+    parser.add_argument(
+        '--refresh', '-r',
+        action='store_true',
+        help='Revalidate every cached detail page with the server, updating entries in --cache-file'
+    )
+    
+    parser.add_argument(
+        '--excel-engine', '-ee',
+        choices=['openpyxl', 'xlsxwriter'],
+        default='openpyxl',
+        help='Excel writer engine; xlsxwriter streams rows to disk with bounded memory (default: openpyxl)'
+    )
+    
     args = parser.parse_args()
     
     # Validate year range
     if args.start_year > args.end_year:
         parser.error(f"Start year ({args.start_year}) must be <= end year ({args.end_year})")
     
+    if args.pdf_workers < 1:
+        parser.error("--pdf-workers must be at least 1")
+    if args.detail_workers < 1:
+        parser.error("--detail-workers must be at least 1")
+    if args.max_rate < 0:
+        parser.error("--max-rate cannot be negative")
+    
+    if args.refresh and not args.cache_file:
+        parser.error("--refresh can only be used with --cache-file")
+    
     # Validate pdf-dir only when download-pdf is enabled
     if not args.download_pdf and args.pdf_dir != 'pdf':
         parser.error("--pdf-dir can only be used with --download-pdf")
@@ -289,46 +755,123 @@ def main():
     conferences = args.conference
     years = list(range(args.start_year, args.end_year + 1))
     
+    if args.cache_file:
+        open_page_cache(args.cache_file, args.refresh)
+    set_max_rate(args.max_rate)
+    
+    # Detail workers and PDF workers can all be fetching at once; the main
+    # thread only fetches listings while the detail workers are idle
+    size_connection_pool(args.detail_workers + (args.pdf_workers if args.download_pdf else 0))
+    
     # Create output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
     
-    # Generate output filename
+    # Generate output filename; Parquet/CSV output is one file per sheet inside the output directory
     conference_str = '_'.join(conferences)
-    output_file = os.path.join(args.output_dir, f"{conference_str}_{args.start_year}_{args.end_year}.xlsx")
+    output_name = f"{conference_str}_{args.start_year}_{args.end_year}"
+    if args.output_format == 'xlsx':
+        output_file = os.path.join(args.output_dir, f"{output_name}.xlsx")
+    else:
+        output_file = args.output_dir
+    
+    # Finished years are appended here as they complete and the Excel file is written once at the end;
+    # Parquet/CSV files are complete per year, so they are written as each year finishes instead
+    checkpoint_file = os.path.join(args.output_dir, f"{output_name}.progress.jsonl")
+    
+    # Options that change the saved rows; a year is only resumed if it was saved with the same ones
+    scrape_options = {"no_abstract": args.no_abstract, "download_pdf": args.download_pdf}
+    if args.download_pdf:
+        scrape_options["pdf_dir"] = args.pdf_dir  # PDF_Path points into it
     
     print(f"Configuration:")
     print(f"  Conferences: {', '.join(conferences)}")
     print(f"  Years: {args.start_year} - {args.end_year}")
     print(f"  Output directory: {args.output_dir}")
-    print(f"  Output file: {output_file}")
+    print(f"  Output format: {args.output_format}")
+    if args.output_format == 'xlsx':
+        print(f"  Output file: {output_file}")
+        print(f"  Excel engine: {args.excel_engine}")
+    print(f"  Fetch abstracts: {not args.no_abstract}")
+    print(f"  Detail workers: {args.detail_workers}")
+    print(f"  Max request rate: {f'{args.max_rate:g}/s' if args.max_rate else 'unlimited'}")
+    print(f"  Page cache: {args.cache_file or 'disabled'}")
+    print(f"  Resume saved years: {not args.no_resume}")
+    if args.refresh:
+        print(f"  Refresh cache: {args.refresh}")
     print(f"  Download PDFs: {args.download_pdf}")
     if args.download_pdf:
         print(f"  PDF directory: {args.pdf_dir}")
+        print(f"  PDF workers: {args.pdf_workers}")
     print()
     
     all_papers = []
     papers_by_sheet = {}  # Dictionary to organize papers by sheet name (conference_year)
     
-    for conference in conferences:
-        for year in years:
-            year_papers = scrape_year(year, conference, args.download_pdf, args.pdf_dir)
-            all_papers.extend(year_papers)
+    # Years finished by an earlier, interrupted xlsx run are taken from its checkpoint
+    resumed_sheets = {}
+    if os.path.exists(checkpoint_file):
+        if args.no_resume:
+            os.remove(checkpoint_file)
+        elif args.output_format == 'xlsx':
+            resumed_sheets = load_checkpoint(checkpoint_file, scrape_options)
+    
+    # PDFs download on their own pool, separate from the detail-page workers
+    pdf_executor = ThreadPoolExecutor(max_workers=args.pdf_workers) if args.download_pdf else None
+    
+    try:
+        for conference in conferences:
+            for year in years:
+                sheet_name = f"{conference}_{year}"
             
-            # Organize papers by sheet name
-            sheet_name = f"{conference}_{year}"
-            if sheet_name not in papers_by_sheet:
-                papers_by_sheet[sheet_name] = []
-            papers_by_sheet[sheet_name].extend(year_papers)
+                # Skip years already saved by an earlier run; empty years are retried
+                if not args.no_resume:
+                    if args.output_format == 'xlsx':
+                        saved_papers = resumed_sheets.get(sheet_name)
+                    else:
+                        saved_papers = load_saved_papers(args.output_dir, sheet_name, args.output_format, scrape_options)
+                    if saved_papers:
+                        all_papers.extend(saved_papers)
+                        papers_by_sheet[sheet_name] = saved_papers
+                        print(f"Skipping {conference} {year}, already saved with {len(saved_papers)} papers")
+                        print()
+                        continue
             
-            print(f"Finished {conference} {year}. Total papers so far: {len(all_papers)}")
+                year_papers = scrape_year(year, conference,
+                                          download_pdfs=args.download_pdf, pdf_dir=args.pdf_dir, pdf_executor=pdf_executor,
+                                          detail_workers=args.detail_workers, fetch_abstracts=not args.no_abstract)
+                all_papers.extend(year_papers)
             
-            # Save intermediate results with multiple sheets
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                for sheet_name, papers in papers_by_sheet.items():
-                    df = pd.DataFrame(papers)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-            print(f"Saved progress to {output_file}")
-            print()
+                # Organize papers by sheet name
+                if sheet_name not in papers_by_sheet:
+                    papers_by_sheet[sheet_name] = []
+                papers_by_sheet[sheet_name].extend(year_papers)
+            
+                print(f"Finished {conference} {year}. Total papers so far: {len(all_papers)}")
+            
+                # Checkpoint only the finished year instead of rewriting every sheet
+                if args.output_format == 'parquet':
+                    save_papers_to_parquet(args.output_dir, {sheet_name: papers_by_sheet[sheet_name]}, scrape_options)
+                    print(f"Saved progress to {os.path.join(args.output_dir, sheet_name + '.parquet')}")
+                elif args.output_format == 'csv':
+                    save_papers_to_csv(args.output_dir, {sheet_name: papers_by_sheet[sheet_name]}, scrape_options)
+                    print(f"Saved progress to {os.path.join(args.output_dir, sheet_name + '.csv')}")
+                else:
+                    append_checkpoint(checkpoint_file, sheet_name, year_papers, scrape_options)
+                    print(f"Saved progress to {checkpoint_file}")
+                print()
+    except BaseException:
+        # Ctrl-C should stop the run, not wait for every PDF already queued
+        if pdf_executor:
+            pdf_executor.shutdown(cancel_futures=True)
+        raise
+
+    if pdf_executor:
+        pdf_executor.shutdown()
+    SESSION.close()
+
+    if args.output_format == 'xlsx':
+        save_papers_to_excel(output_file, papers_by_sheet, args.excel_engine)
+        os.remove(checkpoint_file)
 
     print("Scraping complete!")
     print(f"Total papers scraped: {len(all_papers)}")